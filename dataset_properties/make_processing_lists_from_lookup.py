@@ -19,16 +19,18 @@ def make_processing_lists_from_gee_datasets_lookup(lookup_gee_datasets):
     
     # for regular stat calculation in ploygon 
     # remove country stats (as modal only) and remove buffer stats (assuming buffer only - NB this may change)
-    plot_stats_list = [i for i in all_dataset_list if i not in 
-                              country_allocation_stats_only_list+buffer_stats_list] 
+    not_plot_stats_set = set(country_allocation_stats_only_list+buffer_stats_list) # set made once, for fast membership checks
     
-    decimal_place_column_list =  [i for i in all_dataset_list if i not in presence_only_flag_list + country_allocation_stats_only_list]
+    plot_stats_list = [i for i in all_dataset_list if i not in not_plot_stats_set] 
     
-    return 
-    local_buffer_stats_list, 
-    presence_only_flag_list, 
-    country_allocation_stats_only_list, 
-    plot_stats_list, 
-    decimal_place_column_list
+    not_decimal_place_column_set = set(presence_only_flag_list + country_allocation_stats_only_list)
+    
+    decimal_place_column_list =  [i for i in all_dataset_list if i not in not_decimal_place_column_set]
+    
+    return (buffer_stats_list, 
+            presence_only_flag_list, 
+            country_allocation_stats_only_list, 
+            plot_stats_list, 
+            decimal_place_column_list)
 
 make_processing_lists_from_gee_datasets_lookup(lookup_gee_datasets)
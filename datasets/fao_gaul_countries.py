@@ -16,8 +16,6 @@ def fao_gaul_countries_prep(dataset_id,template_image):
 
     gaul_code_column = "ADM0_CODE"
 
-    template = ee.Image("UMD/hansen/global_forest_change_2022_v1_10");
-
     gaul_boundaries_adm0_code = gaul_boundaries_poly.reduceToImage([gaul_code_column],ee.Reducer.mode())  #make into image with the admn0 country code as the value
 
     #reproject based on template (tyically gfc data - approx 30m res)
@@ -1,13 +1,14 @@
 
 def reproject_to_template(rasterised_vector,template_image):
-    from modules.area_stats import get_scale_from_image
+    from modules.area_stats import get_projection_info_from_image
     """takes an image that has been rasterised but without a scale (resolution) and reprojects to template image CRS and resolution"""
-    #reproject an image
-    crs_template = template_image.select(0).projection().crs().getInfo()
+    #get crs and scale of template (one server call, cached for other datasets using the same template)
+    crs_template, scale_template = get_projection_info_from_image(template_image)
 
+    #reproject an image
     output_image = rasterised_vector.reproject(
       crs= crs_template,
-      scale= get_scale_from_image(template_image),
+      scale= scale_template,
     ).int8()
     
     return output_image
\ No newline at end of file
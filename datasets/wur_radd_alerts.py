@@ -38,7 +38,6 @@ def wur_radd_alerts_prep(dataset_id):
 
     # Update mask for confirmed alerts by date
     latest_radd_alert_confirmed_recent = latest_radd_alert.select('Date').gte(start_date_yyDDD).selfMask()
-    latest_radd_alert_confirmed_recent
 
     latest_radd_alert_confirmed_recent = area_stats.set_scale_property_from_image(
         latest_radd_alert_confirmed_recent,radd.first(),debug=True)
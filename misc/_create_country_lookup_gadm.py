@@ -7,6 +7,8 @@ initialize_ee()
 
 import pandas as pd
 
+import modules.tidy_tables as tidy_tables
+
 lookup_table = tidy_tables.make_lookup_from_feature_col(
     feature_col=ee.FeatureCollection("projects/ee-andyarnellgee/assets/gadm_41_level_1"),
     join_column="fid",lookup_column="GID_0",
@@ -1,9 +1,14 @@
 # functions for setting up session based on usr credentials
 
 def start_agstack_session(email,password,user_registry_base,debug=False):
-    """using session to store cookies that are persistent"""
+    """using session to store cookies that are persistent. 
+    Connections are pooled (kept alive for reuse across asset registry calls) and retried on temporary server errors"""
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     session = requests.session()
+    retries = Retry(total=5, backoff_factor=0.3, status_forcelist=[502, 503, 504]) # GET requests only (urllib3 default) 
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
     session.headers = headers = {
         'Accept': 'application/json',
         'Content-Type': 'application/json'
@@ -1,8 +1,4 @@
-import requests
-import json
-import geojson
 import ee
-import geopandas as gpd
 from modules.area_stats import buffer_point_to_required_area # to handle point features
 
 def geo_id_or_ids_to_feature_collection (all_geo_ids,geo_id_column, session,asset_registry_base,required_area,area_unit,debug=False):
@@ -42,17 +38,20 @@ def true_if_list_false_if_string(python_object,debug=False):
     return boolean
     
 
-def geo_id_list_to_feature_collection(list_of_geo_ids,geo_id_column,session,asset_registry_base,required_area,area_unit):
-    """Converts a list of geo_ids fron asset registry to a feature collection. "Geo_id" is setas a property for each feature)"""
-    out_fc_list = []
-    if isinstance(list_of_geo_ids, list):
-        for geo_id in list_of_geo_ids:
-            feature = geo_id_to_feature(geo_id,geo_id_column,session,asset_registry_base,required_area,area_unit)
-            out_fc_list.append(feature)
-    else:
-        geo_id = list_of_geo_ids
-        feature = geo_id_to_feature(geo_id)
-        out_fc_list.append(feature)
+def geo_id_list_to_feature_collection(list_of_geo_ids,geo_id_column,session,asset_registry_base,required_area,area_unit,max_workers=16):
+    """Converts a list of geo_ids fron asset registry to a feature collection. "Geo_id" is setas a property for each feature). 
+    Geo_ids are fetched in parallel (max_workers threads), as each is a separate request to the asset registry"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if not isinstance(list_of_geo_ids, list):
+        list_of_geo_ids = [list_of_geo_ids]
+    
+    #map keeps the order of the input list
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        out_fc_list = list(executor.map(
+            lambda geo_id: geo_id_to_feature(geo_id,geo_id_column,session,asset_registry_base,required_area,area_unit),
+            list_of_geo_ids))
+    
     return ee.FeatureCollection(out_fc_list)
 
 
@@ -67,24 +66,18 @@ def geo_id_to_feature(geo_id, geo_id_column, session, asset_registry_base,requir
     
     coordinates = geo_json['geometry']['coordinates']
     
-    if check_json_geometry_type(geo_json)=='Polygon':        
+    geometry_type = check_json_geometry_type(geo_json)
+    
+    if geometry_type=='Polygon':        
         poly_feature = ee.Feature(ee.Geometry.Polygon(coordinates),ee.Dictionary([geo_id_column,geo_id]))
         
-    elif check_json_geometry_type(geo_json)=='Point':
+    elif geometry_type=='Point':
         point_feature = ee.Feature(ee.Geometry.Point(coordinates),ee.Dictionary([geo_id_column,geo_id]))
         
         poly_feature = buffer_point_to_required_area(point_feature,required_area,area_unit)
         
     return poly_feature
 
-# def geo_id_to_feature(geo_id, geo_id_column, session, asset_registry_base):
-#     """converts geo_id fron asset registry into a feature with geo_id (or similar) set as a property"""
-#     res = session.get(asset_registry_base + f"/fetch-field/{geo_id}?s2_index=") # s2 indexes. Will need S2 cell token
-#     geo_json = res.json()['Geo JSON']['geometry']['coordinates']  
-#     feature = ee.Feature(ee.Geometry.Polygon(geo_json),ee.Dictionary([geo_id_column,geo_id]))
-#     return feature
-    
-
 
 def check_json_geometry_type(geojson_obj):
     if geojson_obj['type'] == 'Feature':
@@ -1,19 +1,19 @@
 import ee
-import geemap
+import math
 # import area_stats
 
-def zonal_stats_plot_w_buffer (roi, roi_buffer,images_iCol, plot_stats_list, buffer_stats_list, reducer_choice, debug=False):
+def zonal_stats_plot_w_buffer (roi, roi_buffer,images_iCol, plot_stats_list, buffer_stats_list, reducer_choice, debug=False, tile_scale=1):
     """combines zonal_stats_iCol for plot with (alert) stats for buffer zone around it"""   
     
     ## get stats for roi (not including deforestation alerts)
     zonal_stats_plot = zonal_stats_iCol(roi,images_iCol.filter(ee.Filter.inList("system:index",plot_stats_list)),
-                                                                      reducer_choice)# all but alerts
+                                                                      reducer_choice,tile_scale)# all but alerts
     if len(buffer_stats_list)>=1:
     
         ## get stats for buffer (alerts only)
         zonal_stats_buffer = zonal_stats_iCol(roi_buffer,images_iCol.filter(ee.Filter.inList(
                                                             "system:index",buffer_stats_list)),
-                                                            reducer_choice) #alerts only
+                                                            reducer_choice,tile_scale) #alerts only
         
         #combine stats from roi and buffer into one feature collection
         zonal_stats_out= zonal_stats_plot.merge(zonal_stats_buffer)
@@ -25,14 +25,16 @@ def zonal_stats_plot_w_buffer (roi, roi_buffer,images_iCol, plot_stats_list, buf
     return zonal_stats_out
 
 
-def zonal_stats_iCol (feature_collection,image_collection,reducer_choice):
-    "Calculating summary statistics for each image in collection, within each feature in a collection""" 
+def zonal_stats_iCol (feature_collection,image_collection,reducer_choice,tile_scale=1):
+    """Calculating summary statistics for each image in collection, within each feature in a collection. 
+    tile_scale: GEE tileScale (1 is the default; higher e.g. 4 or 8 only if large features hit memory errors, as slower)""" 
   
     def zonal_stats (image):
         scale=image.get("scale")
         fc = ee.FeatureCollection(image.reduceRegions(collection=feature_collection,
                                                       reducer=reducer_choice,
-                                                      scale=scale))
+                                                      scale=scale,
+                                                      tileScale=tile_scale))
         fc = fc.map(lambda feature: feature.set("dataset_name",image.get("system:index")))
         return fc
     
@@ -56,7 +58,21 @@ Template images are used for when target image scale property has been lost (e.g
 
 def get_scale_from_image(image,band_index=0):
     """gets nominal scale from image (NB this should not be from a composite/mosaic or incorrrect value returned)"""
-    return image.select(band_index).projection().nominalScale().getInfo()
+    crs, scale = get_projection_info_from_image(image,band_index)
+    return scale
+
+
+projection_info_cache = {} # filled by get_projection_info_from_image (key: serialized image and band index)
+
+def get_projection_info_from_image(image,band_index=0):
+    """gets crs and nominal scale from image in a single getInfo call. 
+Cached, so the same (template) image used by several datasets is only sent to the server once"""
+    key = (image.serialize(),band_index)
+    if key not in projection_info_cache:
+        projection = image.select(band_index).projection()
+        info = ee.Dictionary({"crs":projection.crs(),"scale":projection.nominalScale()}).getInfo()
+        projection_info_cache[key] = (info["crs"],info["scale"])
+    return projection_info_cache[key]
 
 
 
@@ -118,11 +134,7 @@ def add_area_hectares_property_to_feature_collection(fc,geometry_area_column):
 
 def buffer_point_to_required_area(feature,area,area_unit):
     """buffers feature to get a given area (needs math library); area unit in 'ha' or 'km2' (the default)"""
-    area = feature.get('REP_AREA')
-    
-    # buffer_size = get_radius_m_to_buffer_for_given_area(area,"km2")# should work but untested in this function
-    
-    buffer_size = (ee.Number(feature.get('REP_AREA')).divide(math.pi)).sqrt().multiply(1000) #calculating radius in metres from REP_AREA in km2
+    buffer_size = get_radius_m_to_buffer_to_required_area(area,area_unit) #calculating radius in metres from required area
     
     return ee.Feature(feature).buffer(buffer_size,1);  ### buffering (incl., max error parameter should be 0m. But put as 1m anyhow - doesn't seem to make too much of a difference for speed)
 
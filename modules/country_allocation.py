@@ -1,8 +1,8 @@
 import ee
-import geemap
 
 from parameters.config_lookups import lookup_gee_datasets
 import modules.area_stats as area_stats
+import modules.tidy_tables as tidy_tables
 
 def find_country_from_modal_stats(
     roi,
@@ -11,17 +11,18 @@ def find_country_from_modal_stats(
     geo_id_column,
     country_dataset_id,
     admin_code_col_name,
-    lookup_country_codes_to_names):
+    lookup_country_codes_to_names,
+    tile_scale=1):
     
     """Makes on-the-fly look up table to link country name/iso3 to geo id based on raster stats (uses rasterised admin layer with admin codes as pixel values)"""
 
     #for each geo id finds most common value in that geometry (i.e. "mode" statistic)
     zonal_stats_country_codes = area_stats.zonal_stats_iCol(roi,
                                       image_collection.filter(ee.Filter.eq("country_allocation_stats_only",1)),
-                                      reducer_choice)# all but alerts
+                                      reducer_choice,tile_scale)# all but alerts
     
 
-    df_stats_country_codes = geemap.ee_to_df(zonal_stats_country_codes) #NB limit of 5000 (i have code if this happens)
+    df_stats_country_codes = tidy_tables.ee_to_df_in_chunks(zonal_stats_country_codes) #in chunks as limit of 5000 per call
 
     #get dataset name from lookup to use to select
 
@@ -3,20 +3,31 @@ import sys
 import os
 # from google.oauth2 import service_account
 
+high_volume_url = "https://earthengine-highvolume.googleapis.com"
+
+parameters_dir = os.path.join(os.path.dirname(__file__), '..', 'parameters') # resolved once, on import
+
 #for sepal instance
-def initialize_ee():
-    """Initializes Google Earth Engine with credentials located one level up from the script's directory."""
+def initialize_ee(high_volume=False):
+    """Initializes Google Earth Engine with credentials located one level up from the script's directory.
+    high_volume=True (or environment variable EE_HIGH_VOLUME=1) uses the high-volume endpoint: 
+    for many automated requests (e.g. large numbers of features), not for interactive use"""
     try:
         # Check if EE is already initialized
         if not ee.data._initialized:
+            if high_volume or os.environ.get("EE_HIGH_VOLUME") == "1":
+                opt_url = high_volume_url
+            else:
+                opt_url = None # i.e. standard endpoint
             # ee.Initialize()
             try:
-                ee.Initialize() #cloud project update. Temp workaround for me (Andy)
+                ee.Initialize(opt_url=opt_url) #cloud project update. Temp workaround for me (Andy)
             except: 
                 print("searching for 'gee_cloud_project' in parameters/config_gee.py")
-                sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'parameters'))
+                if parameters_dir not in sys.path:
+                    sys.path.append(parameters_dir)
                 from config_gee import gee_cloud_project
-                ee.Initialize(project="ee-andyarnellgee")
+                ee.Initialize(project="ee-andyarnellgee",opt_url=opt_url)
 
             print("Earth Engine has been initialized with the specified credentials.")
     except Exception as e:
@@ -14,20 +14,13 @@ def add_multi_lookup_properties_to_image_collection(image_collection,\
                                                       ):
     """add multiple (3) columns to properties of image collection. NB join would be better  as slow but for image asset creation anyhow"""
     
-    image_collection_w_properties = add_lookup_property_to_image_collection(image_collection,collection_join_column,
+    image_collection_w_properties = add_lookup_properties_to_image_collection(image_collection,collection_join_column,
                                                            lookup_dataframe, df_join_column,
-                                                           df_column_to_add1,new_property_name1)
+                                                           {new_property_name1:df_column_to_add1,
+                                                            new_property_name2:df_column_to_add2,
+                                                            new_property_name3:df_column_to_add3})
     
-    image_collection_w_properties2 = add_lookup_property_to_image_collection(image_collection_w_properties,collection_join_column,
-                                                           lookup_dataframe, df_join_column,
-                                                           df_column_to_add2,new_property_name2)
-    
-    image_collection_w_properties3 = add_lookup_property_to_image_collection(image_collection_w_properties2,collection_join_column,
-                                                           lookup_dataframe, df_join_column,
-                                                           df_column_to_add3,new_property_name3)
-    
-    
-    return image_collection_w_properties3
+    return image_collection_w_properties
     
     
 
@@ -36,29 +29,46 @@ def add_lookup_property_to_image_collection(image_collection, collection_join_co
                                             df_column_to_add, new_property_name):
     
     """adds property from lookup table using common column/property Note: one-to-one joins only"""
+    return add_lookup_properties_to_image_collection(image_collection, collection_join_column,
+                                                     lookup_dataframe, df_join_column,
+                                                     {new_property_name:df_column_to_add})
+
+
+def add_lookup_properties_to_image_collection(image_collection, collection_join_column, 
+                                              lookup_dataframe, df_join_column, 
+                                              properties_to_add_dict):
+    
+    """adds properties from lookup table using common column/property, in a single pass over the collection.
+    properties_to_add_dict: {new_property_name: df_column_to_add} (so one column can be added as several properties). Note: one-to-one joins only"""
     all_images_list = image_collection.aggregate_array(collection_join_column).getInfo() #to loop over
     
-    new_list=[] #make empty list to fill with images
+    if not lookup_dataframe[df_join_column].is_unique:
+        raise ValueError(f"'{df_join_column}' values in lookup table must be unique (one-to-one joins only)")
+    
+    #make python dictionaries from the columns once (avoids a boolean mask over the whole dataframe per image)
+    join_values = lookup_dataframe[df_join_column].tolist()
+    lookup_dicts = {df_column_to_add: dict(zip(join_values, lookup_dataframe[df_column_to_add].tolist())) 
+                    for df_column_to_add in set(properties_to_add_dict.values())}
+    
+    new_list=[] #make empty python list to fill with images (converted to an image collection once, at the end)
     
     for i in all_images_list: 
         
-        #get value to add to the property from data frame using indexes
-        new_value = (lookup_dataframe[df_column_to_add][lookup_dataframe[df_join_column]==i]).item()
-        
         #filter to jsut image with this property - must be unique else will get errors
         image = image_collection.filter(ee.Filter.eq(collection_join_column,i)).first()
         
-        #set new property
-        image_w_new_property = image.set(new_property_name,new_value)
+        #set new properties in a single call, getting values to add from lookup dictionaries
+        image = image.set({new_property_name: lookup_dicts[df_column_to_add][i] 
+                           for new_property_name, df_column_to_add in properties_to_add_dict.items()})
         
-        #append image with new property to list
-        new_list = ee.List(new_list).add(ee.List(image_w_new_property))
+        #append image with new properties to list
+        new_list.append(image)
         
     return ee.ImageCollection(new_list) #turn list into output image collection
 
 
 def remap_image_from_csv_cols (image,csv_path,from_col,to_col,default_value):
-    df =pd.read_csv(csv_path)
+    df =pd.read_csv(csv_path,usecols=[from_col,to_col]) # only read columns needed for remap
     image_out= remap_image_from_dataframe_cols(image,df,from_col,to_col,default_value)
     return image_out
 
@@ -88,13 +98,15 @@ def export_image_collection_to_asset(make_empty_image_coll, image_col_to_export,
     imageCollectionImageList = (imageNames(ee.ImageCollection(target_image_col_id)))
 
 
-    for i in range(image_col_to_export.size().getInfo()):
+    image_col_to_export_list = image_col_to_export.toList(10000,0) # make list once, outside of the loop
 
-        image_new = ee.Image(image_col_to_export.toList(10000,0).get(i))
+    # names and scales for all images in one getInfo call (instead of two calls per image)
+    names_and_scales = image_col_to_export_list.map(
+        lambda image: ee.List([ee.Image(image).get(asset_exists_property),ee.Image(image).get("scale")])).getInfo()
 
-        dataset_name = image_new.get(asset_exists_property).getInfo()
+    for i, (dataset_name, output_scale) in enumerate(names_and_scales):
 
-        output_scale = image_new.get("scale").getInfo()
+        image_new = ee.Image(image_col_to_export_list.get(i))
 
         out_name = target_image_col_id+"/"+dataset_name
 
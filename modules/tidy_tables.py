@@ -1,5 +1,6 @@
 import pandas as pd
 import ee
+from collections import OrderedDict
 
 def tidy_dataframe_after_pivot (df):
     """Tidying dataframe after long-to-wide reformatting, incl. removes unwanted levels, column names"""
@@ -14,9 +15,10 @@ def tidy_dataframe_after_pivot (df):
 def reorder_columns_by_lookup(df,lookup_df,dataset_order_column,dataset_name_column,prefix_columns_list=[]):    
     """ reorder columns by creating an ordered list from a lookup_df containing column order and dataset names that match those in results dataframe"""
 
-    ordered_dataset_df= lookup_df.sort_values(by=['dataset_order'])
+    # select only the two columns needed before sorting (avoids copying the whole lookup table)
+    ordered_dataset_df= lookup_df[[dataset_order_column,dataset_name_column]].sort_values(by=[dataset_order_column])
     
-    column_order_list = list(ordered_dataset_df["dataset_name"])
+    column_order_list = ordered_dataset_df[dataset_name_column].tolist()
     
     # adds in a list of columns to the start of the order list (i.e. the geo_id, geometry area column and country columns), if left blanmk nothing added
     column_order_list = prefix_columns_list + column_order_list
@@ -50,4 +52,60 @@ def make_lookup_from_feature_col(feature_col,join_column,lookup_column,join_colu
 
 def truncate_strings_in_list(input_list, max_length):
     """as name suggests, useful for exporting to shapefiles fort instance where col name length is limited"""
-    return [string[:max_length] for string in input_list]
\ No newline at end of file
+    return [string[:max_length] for string in input_list]
+
+
+ee_to_df_cache = OrderedDict() # filled by ee_to_df_in_chunks if use_cache (key: serialized feature collection and chunk size)
+
+ee_to_df_cache_max_size = 16 # least recently used results dropped after this
+
+
+def ee_to_df_in_chunks(feature_collection,chunk_size=5000,max_workers=8,use_cache=False,debug=False):
+    """converts feature collection to pandas dataframe in chunks of features (geemap.ee_to_df has a limit of 5000 features per call).
+    Collections under the limit are converted in a single call as before. 
+    Chunks are requested in parallel (max_workers threads) as each is an independent server request.
+    If use_cache, results are kept for the session so the same feature collection is only fetched once (a copy is returned). 
+    Off by default: only use for collections that won't change during the session (e.g. not stats from assets that are being updated)"""
+    if use_cache:
+        cache_key = (feature_collection.serialize(),chunk_size)
+        if cache_key in ee_to_df_cache:
+            if debug: print ("using cached dataframe")
+            ee_to_df_cache.move_to_end(cache_key) # mark as recently used
+            return ee_to_df_cache[cache_key].copy()
+    
+    df = fetch_ee_to_df_in_chunks(feature_collection,chunk_size,max_workers,debug)
+    
+    if use_cache:
+        ee_to_df_cache[cache_key] = df.copy()
+        if len(ee_to_df_cache) > ee_to_df_cache_max_size:
+            ee_to_df_cache.popitem(last=False) # remove least recently used
+    
+    return df
+
+
+def fetch_ee_to_df_in_chunks(feature_collection,chunk_size=5000,max_workers=8,debug=False):
+    """fetches feature collection as pandas dataframe, in chunks if over the 5000 feature limit (see ee_to_df_in_chunks). 
+    Tries a single call first, so collections under the limit cost one request (no extra size() call)"""
+    import geemap
+    from concurrent.futures import ThreadPoolExecutor
+    
+    try:
+        return geemap.ee_to_df(feature_collection)
+    except Exception as e:
+        if "accumulating over" not in str(e): # i.e. not the "Collection query aborted after accumulating over 5000 elements" error
+            raise
+        if debug: print ("over feature limit for a single call, converting in chunks")
+    
+    collection_size = feature_collection.size().getInfo() # only needed (and requested) for large collections
+    
+    #each chunk is its own server request, so only take the features needed for that chunk
+    feature_collection_chunks = [ee.FeatureCollection(feature_collection.toList(chunk_size,offset)) 
+                                 for offset in range(0,collection_size,chunk_size)]
+    
+    if debug: print ("converting", collection_size, "features in", len(feature_collection_chunks), "chunks")
+    
+    #map keeps chunk order, so rows stay in the same order as the feature collection
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        df_list = list(executor.map(geemap.ee_to_df,feature_collection_chunks))
+    
+    return pd.concat(df_list,ignore_index=True)
@@ -1,7 +1,9 @@
 import os
 import ee
 
-ee.Initialize()
+from modules.gee_initialize import initialize_ee
+
+initialize_ee() # only initializes if not done already (e.g. by the notebook before importing parameters)
 
 
 #if exporting to an image collection
@@ -10,6 +10,9 @@ update_iCol_properties = False # adds time so only put as True if need to update
 debug = True  # get print messages or not (e.g. for debugging code etc) (True or False)
 
 
+# GEE tileScale for zonal stats (reduceRegions). 1 (GEE default) is quickest; increase (e.g. 4 or 8) only if large plots hit memory errors
+tile_scale = 1
+
 # what datasets to exclude from results
 exclusion_list_dataset_ids = [2,14,15]
 